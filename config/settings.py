@@ -19,14 +19,22 @@ AVAILABLE_MODELS = [
 CHUNK_SIZE = 1000
 CHUNK_OVERLAP = 200
 EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')  # "torch", "onnx", or "openvino"
+EMBEDDING_INT8 = os.getenv('LEXILOCAL_INT8') == '1'  # dynamic int8 quantization (torch backend)
 
 # Search Configuration
 DEFAULT_K_RESULTS = 3
 MAX_K_RESULTS = 10
 
+# FAISS Indexing
+FLAT_INDEX_MAX_VECTORS = 10000  # Above this, use IVF-PQ for sublinear search
+FAISS_NPROBE = 16  # Number of IVF cells probed per query
+EMBEDDING_PRECISION = "float32"  # "float32", "float16", or "int8" index storage
+
 # Performance
 BATCH_SIZE = 32
 MAX_SEQUENCE_LENGTH = 512
+EMBEDDING_THREADS = int(os.getenv('EMBEDDING_THREADS', os.cpu_count() or 1))
 
 # File Paths
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
@@ -83,15 +83,16 @@ def measure_performance():
     ]
     
     search_times = []
-    for query in search_queries:
-        start_time = time.time()
-        try:
-            results = rag.doc_processor.search_similar_chunks(query, k=5)
-            search_time = time.time() - start_time
-            search_times.append(search_time)
-            print(f"  Query '{query}': {search_time:.3f}s ({len(results)} results)")
-        except Exception as e:
-            print(f"  Query '{query}': Error - {str(e)}")
+    start_time = time.time()
+    try:
+        batch_results = rag.doc_processor.search_similar_chunks_batch(search_queries, k=5)
+        batch_time = time.time() - start_time
+        search_times.append(batch_time)
+        print(f"  Batched {len(search_queries)} queries: {batch_time:.3f}s")
+        for query, results in zip(search_queries, batch_results):
+            print(f"    '{query}': {len(results)} results")
+    except Exception as e:
+        print(f"  Batched search: Error - {str(e)}")
     
     # Performance Summary
     print("\n" + "=" * 50)
@@ -5,6 +5,8 @@ Performance testing script for LexiLocal.
 
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from lexilocal.core.rag_system import LegalRAGSystem
@@ -12,6 +14,12 @@ from lexilocal.data.mock_data import get_mock_dataset
 from lexilocal.utils.performance_metrics import PerformanceMetrics
 from lexilocal.utils.logging_config import setup_logging
 
+def _timed(fn, *args):
+    """Run fn(*args) and return (result, elapsed_seconds)."""
+    start = time.time()
+    result = fn(*args)
+    return result, time.time() - start
+
 def main():
     """Run comprehensive performance tests."""
     setup_logging(level="INFO")
@@ -21,9 +29,13 @@ def main():
     print("🔍 LexiLocal Performance Testing")
     print("=" * 50)
     
-    # Initialize system
+    # Initialize system (the embedding cache makes repeat runs skip
+    # re-encoding unchanged documents)
     with metrics.measure_time('initialization_time'):
-        rag = LegalRAGSystem(model_name="llama3.2:1b")
+        rag = LegalRAGSystem(
+            model_name="llama3.2:1b",
+            embedding_cache_dir=os.path.expanduser("~/.cache/lexilocal/embeddings")
+        )
     
     # Load documents
     with metrics.measure_time('document_loading_time'):
@@ -39,26 +51,39 @@ def main():
         "What happens when time is of the essence?"
     ]
     
+    # The LLM-bound loops run concurrently: Ollama generation is I/O-bound
+    # (the socket reads release the GIL), so threads overlap the waits.
+    # Each task times itself and the main thread records the metrics.
     print("\n🤖 Testing Q&A Performance...")
-    for question in test_questions:
-        with metrics.measure_time('qa_response_times'):
-            result = rag.ask_question(question)
-            print(f"  ✅ Question processed: {len(result['sources'])} sources")
-    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        qa_outcomes = list(executor.map(
+            lambda question: _timed(rag.ask_question, question),
+            test_questions
+        ))
+    for result, elapsed in qa_outcomes:
+        metrics.add_metric('qa_response_times', elapsed)
+        print(f"  ✅ Question processed: {len(result['sources'])} sources")
+
     # Test summarization
     print("\n📄 Testing Summarization Performance...")
-    for doc in mock_docs:
-        with metrics.measure_time('summarization_times'):
-            result = rag.summarize_by_title(doc['title'])
-            print(f"  ✅ Summary generated: {len(result['summary'])} chars")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        summary_outcomes = list(executor.map(
+            lambda doc: _timed(rag.summarize_by_title, doc['title']),
+            mock_docs
+        ))
+    for result, elapsed in summary_outcomes:
+        metrics.add_metric('summarization_times', elapsed)
+        print(f"  ✅ Summary generated: {len(result['summary'])} chars")
     
     # Test search
     print("\n🔍 Testing Search Performance...")
     search_queries = ["contract breach", "Fourth Amendment", "patent infringement"]
     for query in search_queries:
+        # Print outside the timed block so stdout flushes don't pollute
+        # the sub-millisecond search measurements
         with metrics.measure_time('search_times'):
             results = rag.doc_processor.search_similar_chunks(query, k=5)
-            print(f"  ✅ Search '{query}': {len(results)} results")
+        print(f"  ✅ Search '{query}': {len(results)} results")
     
     # Print and export results
     metrics.print_summary()
@@ -8,7 +8,26 @@ import sys
 import subprocess
 
 def set_environment():
-    """Set environment variables for optimal Streamlit operation."""
+    """Set environment variables for optimal Streamlit operation.
+
+    Note: Streamlit re-runs the app script on every widget interaction, so
+    LegalRAGSystem construction in the UI must stay behind @st.cache_resource
+    (see load_rag_system in streamlit_app.py) — without that singleton the
+    embedding model is reloaded on each click and eventually OOMs.
+    """
+    # Keep reruns cheap
+    os.environ["STREAMLIT_RUNNER_FAST_RERUNS"] = "true"
+
+    # Thread counts for the numerical libraries: FAISS search and
+    # sentence-transformers encoding both respect OMP_NUM_THREADS. Half the
+    # cores avoids oversubscription between the torch and FAISS pools.
+    num_threads = str(max(1, (os.cpu_count() or 2) // 2))
+    os.environ.setdefault("OMP_NUM_THREADS", num_threads)
+    os.environ.setdefault("MKL_NUM_THREADS", num_threads)
+
+    # Avoid HF tokenizers fork-safety stalls (and their warning spam)
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
     # Disable Streamlit file watcher to prevent torch conflicts
     os.environ["STREAMLIT_SERVER_FILE_WATCHER_TYPE"] = "none"
     os.environ["STREAMLIT_GLOBAL_DEVELOPMENT_MODE"] = "false"
@@ -38,14 +57,29 @@ def main():
     print("🛑 Press Ctrl+C to stop")
     
     try:
-        # Start Streamlit
+        # Start Streamlit in-process: skips a second interpreter + import
+        # cost, and the env vars from set_environment() apply directly
         app_path = os.path.join(os.path.dirname(__file__), '..', 'app.py')
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", app_path,
-            "--server.headless", "true",
-            "--server.fileWatcherType", "none",
-            "--logger.level", "error"
-        ])
+        try:
+            from streamlit.web import bootstrap
+            # Same config the subprocess invocation passes as CLI flags;
+            # bootstrap's args parameter is script args, so config has to
+            # go through flag_options instead
+            flag_options = {
+                "server.headless": True,
+                "server.fileWatcherType": "none",
+                "logger.level": "error",
+            }
+            bootstrap.load_config_options(flag_options=flag_options)
+            bootstrap.run(app_path, False, [], flag_options)
+        except ImportError:
+            # Older Streamlit without the bootstrap module
+            subprocess.run([
+                sys.executable, "-m", "streamlit", "run", app_path,
+                "--server.headless", "true",
+                "--server.fileWatcherType", "none",
+                "--logger.level", "error"
+            ])
     except KeyboardInterrupt:
         print("\n🛑 Shutting down LexiLocal...")
     except Exception as e:
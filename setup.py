@@ -25,6 +25,7 @@ setup(
     url="https://github.com/DylanSatow/LexiLocal",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"lexilocal.data": ["*.json"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Legal Industry",
@@ -54,6 +55,10 @@ setup(
             "torch[gpu]",
             "faiss-gpu",
         ],
+        "performance": [
+            "semantic-text-splitter>=0.13",
+            "numba>=0.58",
+        ],
     },
     entry_points={
         "console_scripts": [
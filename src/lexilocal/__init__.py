@@ -9,12 +9,23 @@ __version__ = "1.0.0"
 __author__ = "Dylan Satow"
 __email__ = "your.email@example.com"
 
-from .core.rag_system import LegalRAGSystem
-from .core.document_processor import DocumentProcessor
-from .data.mock_data import get_mock_dataset
-
 __all__ = [
     "LegalRAGSystem",
-    "DocumentProcessor", 
+    "DocumentProcessor",
     "get_mock_dataset"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # PEP 562 lazy attribute access: torch, sentence-transformers, and FAISS
+    # only load when the heavy classes are first touched, keeping
+    # `import lexilocal` cheap for callers that just need the data helpers
+    if name == "LegalRAGSystem":
+        from .core.rag_system import LegalRAGSystem
+        return LegalRAGSystem
+    if name == "DocumentProcessor":
+        from .core.document_processor import DocumentProcessor
+        return DocumentProcessor
+    if name == "get_mock_dataset":
+        from .data.mock_data import get_mock_dataset
+        return get_mock_dataset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,13 @@
 """Core modules for LexiLocal legal document analysis."""
 
-from .document_processor import DocumentProcessor
-from .rag_system import LegalRAGSystem
+__all__ = ["DocumentProcessor", "LegalRAGSystem"]
 
-__all__ = ["DocumentProcessor", "LegalRAGSystem"]
\ No newline at end of file
+def __getattr__(name):
+    # Lazy imports keep `import lexilocal.core` from pulling in torch/FAISS
+    if name == "DocumentProcessor":
+        from .document_processor import DocumentProcessor
+        return DocumentProcessor
+    if name == "LegalRAGSystem":
+        from .rag_system import LegalRAGSystem
+        return LegalRAGSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Numerical kernels for the non-FAISS similarity search fallback.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    # cache=True persists the compiled kernel under __pycache__, so the
+    # one-off JIT cost is paid on first import only
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _inner_products(queries, matrix):
+        out = np.empty((queries.shape[0], matrix.shape[0]), dtype=np.float32)
+        for i in prange(queries.shape[0]):
+            for j in range(matrix.shape[0]):
+                acc = np.float32(0.0)
+                for d in range(queries.shape[1]):
+                    acc += queries[i, d] * matrix[j, d]
+                out[i, j] = acc
+        return out
+else:
+    def _inner_products(queries, matrix):
+        return queries @ matrix.T
+
+def cosine_topk(queries, matrix, k):
+    """Top-k inner products of L2-normalized queries against a matrix.
+
+    Returns (scores, indices) arrays shaped (num_queries, k), mirroring
+    faiss.Index.search so callers can swap between the two backends.
+    """
+    queries = np.ascontiguousarray(queries, dtype=np.float32)
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+
+    scores = _inner_products(queries, matrix)
+    k = min(k, matrix.shape[0])
+
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    rows = np.arange(scores.shape[0])[:, None]
+    order = np.argsort(-scores[rows, top], axis=1)
+    indices = top[rows, order]
+    return scores[rows, indices], indices
@@ -1,116 +1,420 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
+import math
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from sentence_transformers import SentenceTransformer
-import faiss
+import json
 import pickle
 import os
 from ..data.mock_data import get_mock_dataset
+from ..utils.perf import configure_threading
+from ._kernels import cosine_topk
+
+try:
+    import faiss
+except ImportError:
+    # Search falls back to the (Numba-accelerated) NumPy kernels
+    faiss = None
+
+try:
+    # Arrow metadata files deserialize through C++ and can be memory-mapped
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:
+    pa = None
+    feather = None
+
+try:
+    # Rust-backed splitter; far faster than the pure-Python recursive
+    # splitter on large corpora
+    from semantic_text_splitter import TextSplitter as RustTextSplitter
+except ImportError:
+    RustTextSplitter = None
+
+# Corpora below this size keep the brute-force flat index; larger corpora
+# get an IVF-PQ index for sublinear search at a small recall cost
+FLAT_INDEX_MAX_VECTORS = 10000
+
+# Below this size the host-to-device transfer outweighs GPU search gains,
+# so the index stays on CPU even when a GPU is present
+GPU_INDEX_MIN_VECTORS = 50000
 
 class DocumentProcessor:
-    def __init__(self, 
-                 chunk_size: int = 1000, 
+    def __init__(self,
+                 chunk_size: int = 1000,
                  chunk_overlap: int = 200,
-                 embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"):
+                 embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+                 nprobe: int = 16,
+                 batch_size: int = 32,
+                 embedding_precision: str = "float32",
+                 backend: str = "torch",
+                 query_cache_size: int = 1024,
+                 embedding_cache_dir: Optional[str] = None):
         """Initialize document processor with chunking and embedding capabilities"""
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.nprobe = nprobe
+        self.batch_size = batch_size
+        self.embedding_precision = embedding_precision
+        self.embedding_cache_dir = embedding_cache_dir
         
-        # Initialize text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", " ", ""]
-        )
+        # Initialize text splitter (Rust-backed when installed)
+        if RustTextSplitter is not None:
+            self.text_splitter = RustTextSplitter(capacity=chunk_size, overlap=chunk_overlap)
+            self._split_text = self.text_splitter.chunks
+        else:
+            self.text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=["\n\n", "\n", " ", ""]
+            )
+            self._split_text = self.text_splitter.split_text
         
-        # Initialize embedding model
+        # Tune torch/OpenMP thread counts before any inference runs
+        configure_threading()
+
+        # Initialize embedding model; "onnx" / "openvino" backends run the
+        # encoder through optimized inference runtimes (~4x on CPU) while
+        # keeping encode() behavior identical
         print(f"Loading embedding model: {embedding_model}")
-        self.embedding_model = SentenceTransformer(embedding_model)
+        self.embedding_model_name = embedding_model
+        self.backend = backend
+        if backend != "torch":
+            try:
+                self.embedding_model = SentenceTransformer(embedding_model, backend=backend)
+            except (TypeError, ValueError, ImportError) as e:
+                print(f"Embedding backend '{backend}' unavailable ({e}), falling back to torch")
+                self.backend = "torch"
+                self.embedding_model = SentenceTransformer(embedding_model)
+        else:
+            self.embedding_model = SentenceTransformer(embedding_model)
         self.embedding_dim = self.embedding_model.get_sentence_embedding_dimension()
-        
+
+        # Opt-in dynamic int8 quantization for the torch CPU path: Linear
+        # layers run int8 GEMMs (~2x encode throughput, 4x less model
+        # memory) at a small accuracy cost. encode() is unaffected.
+        self.int8_quantized = (
+            os.environ.get('LEXILOCAL_INT8') == '1' and self.backend == "torch"
+        )
+        if self.int8_quantized:
+            import torch
+            transformer = self.embedding_model._first_module()
+            transformer.auto_model = torch.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            print("Embedding model quantized to int8 (LEXILOCAL_INT8=1)")
+
         # Storage for chunks and metadata
         self.chunks = []
         self.chunk_metadata = []
+        self.doc_ids_seen = set()
+        self.doc_to_chunks = defaultdict(list)  # doc_id -> chunk indices
         self.faiss_index = None
+        self._embeddings = None  # normalized matrix for the no-FAISS fallback
+        self._gpu_resources = None
+        self._index_on_gpu = False
+
+        # Per-instance LRU cache so repeated queries skip the transformer
+        # forward pass entirely
+        self._encode_query = functools.lru_cache(maxsize=query_cache_size)(self._encode_query_uncached)
         
     def process_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Process documents by chunking and creating embeddings"""
         print(f"Processing {len(documents)} documents...")
-        
+
+        all_chunks, all_metadata = self._chunk_documents(documents)
+
+        print(f"Created {len(all_chunks)} chunks from {len(documents)} documents")
+
+        # Generate embeddings (normalized inside the model's batched path)
+        print("Generating embeddings...")
+        embeddings = self._encode_texts(all_chunks, show_progress_bar=True)
+
+        # Store chunks and metadata
+        self.chunks = all_chunks
+        self.chunk_metadata = all_metadata
+        self.doc_ids_seen = {meta['doc_id'] for meta in all_metadata}
+        self._rebuild_doc_index()
+
+        # Create FAISS index
+        self.create_faiss_index(embeddings)
+
+    def add_documents(self, documents: List[Dict[str, Any]]) -> None:
+        """Incrementally add documents without re-encoding the existing corpus"""
+        if self.faiss_index is None and self._embeddings is None:
+            self.process_documents(documents)
+            return
+
+        new_docs = [doc for doc in documents
+                    if doc.get('id') is None or doc.get('id') not in self.doc_ids_seen]
+        if not new_docs:
+            print("No new documents to add")
+            return
+
+        new_chunks, new_metadata = self._chunk_documents(
+            new_docs, doc_idx_offset=len(self.doc_ids_seen)
+        )
+        if not new_chunks:
+            return
+
+        print(f"Adding {len(new_chunks)} chunks from {len(new_docs)} new documents")
+        embeddings = self._encode_texts(new_chunks, show_progress_bar=True)
+        embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+        if self.faiss_index is not None:
+            # Already unit-normalized by the encoder; add directly
+            self.faiss_index.add(embeddings)
+        else:
+            self._embeddings = np.vstack([self._embeddings, embeddings])
+
+        base_idx = len(self.chunks)
+        self.chunks.extend(new_chunks)
+        self.chunk_metadata.extend(new_metadata)
+        self.doc_ids_seen.update(meta['doc_id'] for meta in new_metadata)
+        for offset, meta in enumerate(new_metadata):
+            self.doc_to_chunks[meta['doc_id']].append(base_idx + offset)
+
+    def _chunk_documents(self, documents: List[Dict[str, Any]],
+                         doc_idx_offset: int = 0) -> tuple:
+        """Chunk documents in parallel and assemble per-chunk metadata"""
         all_chunks = []
         all_metadata = []
-        
-        for doc_idx, doc in enumerate(documents):
-            document_text = doc.get('document', '')
-            if not document_text.strip():
+
+        # Chunk documents in parallel; the Rust splitter releases the GIL so
+        # threads scale across cores, and threads avoid pickling the splitter
+        with ThreadPoolExecutor() as executor:
+            chunked_docs = list(executor.map(
+                lambda text: self._split_text(text) if text.strip() else [],
+                [doc.get('document', '') for doc in documents]
+            ))
+
+        for doc_idx, (doc, chunks) in enumerate(zip(documents, chunked_docs), start=doc_idx_offset):
+            if not chunks:
                 continue
-                
-            # Split document into chunks
-            chunks = self.text_splitter.split_text(document_text)
-            
+
+            # Resolve shared per-document fields once; per-chunk records merge
+            # them at C level and share the value objects instead of repeating
+            # the dict lookups for every chunk
+            doc_id = doc.get('id', f'doc_{doc_idx}')
+            doc_base = {
+                'doc_id': doc_id,
+                'title': doc.get('title', ''),
+                'citation': doc.get('citation', ''),
+                'state': doc.get('state', ''),
+                'issuer': doc.get('issuer', ''),
+                'total_chunks': len(chunks)
+            }
+
             for chunk_idx, chunk in enumerate(chunks):
                 all_chunks.append(chunk)
                 all_metadata.append({
-                    'doc_id': doc.get('id', f'doc_{doc_idx}'),
-                    'chunk_id': f"{doc.get('id', f'doc_{doc_idx}')}_{chunk_idx}",
-                    'title': doc.get('title', ''),
-                    'citation': doc.get('citation', ''),
-                    'state': doc.get('state', ''),
-                    'issuer': doc.get('issuer', ''),
+                    **doc_base,
+                    'chunk_id': f"{doc_id}_{chunk_idx}",
                     'chunk_index': chunk_idx,
-                    'total_chunks': len(chunks),
                     'text': chunk
                 })
-        
-        print(f"Created {len(all_chunks)} chunks from {len(documents)} documents")
-        
-        # Generate embeddings
-        print("Generating embeddings...")
-        embeddings = self.embedding_model.encode(all_chunks, show_progress_bar=True)
-        
-        # Store chunks and metadata
-        self.chunks = all_chunks
-        self.chunk_metadata = all_metadata
-        
-        # Create FAISS index
-        self.create_faiss_index(embeddings)
-        
+
+        return all_chunks, all_metadata
+
+    def _encoder_fingerprint(self) -> str:
+        """Cache namespace identifying how this processor produces vectors"""
+        config = '|'.join([
+            self.embedding_model_name,
+            self.backend,
+            f"int8={int(self.int8_quantized)}"
+        ])
+        return hashlib.sha1(config.encode()).hexdigest()[:12]
+
+    def _encode_texts(self, texts: List[str], show_progress_bar: bool = False) -> np.ndarray:
+        """Encode texts, serving unchanged ones from the content-hash cache if enabled"""
+        if self.embedding_cache_dir is None:
+            return self._encode_texts_batch(texts, show_progress_bar)
+
+        # Content-addressed cache: sha256(chunk) -> .npy inside a
+        # subdirectory keyed by the encoder configuration. Vectors depend on
+        # the model, backend and quantization, so switching any of those
+        # (e.g. benchmarking fp32 vs int8) gets a fresh namespace instead of
+        # silently reusing vectors from the previous configuration.
+        cache_dir = os.path.join(
+            self.embedding_cache_dir, self._encoder_fingerprint()
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+
+        hashes = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+        embeddings = np.empty((len(texts), self.embedding_dim), dtype='float32')
+        miss_indices = []
+        for i, text_hash in enumerate(hashes):
+            cache_path = os.path.join(cache_dir, f"{text_hash}.npy")
+            if os.path.exists(cache_path):
+                embeddings[i] = np.load(cache_path)
+            else:
+                miss_indices.append(i)
+
+        if miss_indices:
+            fresh = self._encode_texts_batch(
+                [texts[i] for i in miss_indices], show_progress_bar
+            )
+            for j, i in enumerate(miss_indices):
+                embeddings[i] = fresh[j]
+                np.save(os.path.join(cache_dir, f"{hashes[i]}.npy"), fresh[j])
+
+        return embeddings
+
+    def _encode_texts_batch(self, texts: List[str], show_progress_bar: bool = False) -> np.ndarray:
+        """Encode texts in length-sorted batches so padding per batch is minimal
+
+        Sorting by length keeps each batch's padding to the longest member of
+        that batch rather than the longest text overall; the permutation is
+        inverted afterwards so embeddings line up with the input order.
+        """
+        order = np.argsort([len(t) for t in texts])
+        embeddings = self.embedding_model.encode(
+            [texts[i] for i in order],
+            batch_size=self.batch_size,
+            show_progress_bar=show_progress_bar,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        inverse = np.argsort(order)
+        return embeddings[inverse]
+
     def create_faiss_index(self, embeddings: np.ndarray) -> None:
         """Create FAISS index from embeddings"""
+        if faiss is None:
+            # No FAISS: keep the (encode-normalized) matrix and search it
+            # with the cosine_topk fallback kernel
+            print("FAISS unavailable; using brute-force similarity fallback")
+            self._embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+            return
+
         print("Creating FAISS index...")
-        
-        # Normalize embeddings for cosine similarity
-        embeddings_normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-        
+
+        # The encoder already emits unit-normalized vectors
+        # (normalize_embeddings=True), so inner product = cosine similarity
+        # with no extra normalization pass over the matrix
+        embeddings_normalized = np.ascontiguousarray(embeddings, dtype='float32')
+
         # Create FAISS index (using Inner Product for normalized vectors = cosine similarity)
-        self.faiss_index = faiss.IndexFlatIP(self.embedding_dim)
-        self.faiss_index.add(embeddings_normalized.astype('float32'))
-        
+        num_vectors = embeddings_normalized.shape[0]
+
+        if num_vectors < FLAT_INDEX_MAX_VECTORS:
+            # Brute-force search is fast enough for small corpora; scalar
+            # quantization cuts memory bandwidth 2-4x in the distance loop
+            if self.embedding_precision == "float16":
+                self.faiss_index = faiss.IndexScalarQuantizer(
+                    self.embedding_dim, faiss.ScalarQuantizer.QT_fp16,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                self.faiss_index.train(embeddings_normalized)
+            elif self.embedding_precision == "int8":
+                self.faiss_index = faiss.IndexScalarQuantizer(
+                    self.embedding_dim, faiss.ScalarQuantizer.QT_8bit,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                self.faiss_index.train(embeddings_normalized)
+            else:
+                self.faiss_index = faiss.IndexFlatIP(self.embedding_dim)
+        else:
+            # IVF-PQ: sublinear search with ~16x lower memory at a small recall cost
+            nlist = int(4 * math.sqrt(num_vectors))
+            quantizer = faiss.IndexFlatIP(self.embedding_dim)
+            self.faiss_index = faiss.IndexIVFPQ(
+                quantizer, self.embedding_dim, nlist, 16, 8,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            self.faiss_index.train(embeddings_normalized)
+            self.faiss_index.nprobe = self.nprobe
+
+        self.faiss_index.add(embeddings_normalized)
+
+        # Move to GPU for large corpora where search gains outweigh transfer cost
+        self._maybe_move_index_to_gpu()
+
         print(f"FAISS index created with {self.faiss_index.ntotal} vectors")
+
+    def _maybe_move_index_to_gpu(self) -> None:
+        """Move the index to GPU when CUDA FAISS is available and the corpus is large enough"""
+        # The flag tracks where the current index actually lives; a rebuild
+        # that stays on CPU must clear it even if GPU resources were
+        # allocated for an earlier, larger index
+        self._index_on_gpu = False
+        num_gpus = getattr(faiss, 'get_num_gpus', lambda: 0)()
+        if num_gpus == 0 or self.faiss_index.ntotal < GPU_INDEX_MIN_VECTORS:
+            return
+
+        print("Moving FAISS index to GPU...")
+        if self._gpu_resources is None:
+            self._gpu_resources = faiss.StandardGpuResources()
+        self.faiss_index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.faiss_index)
+        self._index_on_gpu = True
         
+    def _search_vectors(self, query_embeddings: np.ndarray, k: int):
+        """Search the FAISS index, or the fallback kernel when FAISS is absent"""
+        if self.faiss_index is not None:
+            return self.faiss_index.search(query_embeddings, k)
+        if self._embeddings is not None:
+            return cosine_topk(query_embeddings, self._embeddings, k)
+        raise ValueError("FAISS index not created. Call process_documents first.")
+
     def search_similar_chunks(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """Search for similar chunks given a query"""
-        if self.faiss_index is None:
-            raise ValueError("FAISS index not created. Call process_documents first.")
-        
-        # Encode query
-        query_embedding = self.embedding_model.encode([query])
-        query_embedding_normalized = query_embedding / np.linalg.norm(query_embedding, axis=1, keepdims=True)
-        
+        # Encode query (cached; normalized inside the model)
+        query_embedding = self._encode_query(query)
+
         # Search FAISS index
-        scores, indices = self.faiss_index.search(query_embedding_normalized.astype('float32'), k)
-        
-        # Return results with metadata
+        scores, indices = self._search_vectors(query_embedding, k)
+
+        return self._collect_search_results(scores[0], indices[0])
+
+    def search_similar_chunks_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Search for similar chunks for a batch of queries in a single FAISS call"""
+        # Encode all queries in one forward pass
+        query_embeddings = self.embedding_model.encode(
+            queries, batch_size=self.batch_size, convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        query_embeddings = np.ascontiguousarray(query_embeddings, dtype='float32')
+
+        # One search call returns (num_queries, k) score/index matrices
+        scores, indices = self._search_vectors(query_embeddings, k)
+
+        return [self._collect_search_results(score_row, index_row)
+                for score_row, index_row in zip(scores, indices)]
+
+    def _rebuild_doc_index(self) -> None:
+        """Rebuild the doc_id -> chunk indices mapping from chunk metadata"""
+        self.doc_to_chunks = defaultdict(list)
+        for idx, meta in enumerate(self.chunk_metadata):
+            self.doc_to_chunks[meta['doc_id']].append(idx)
+
+    def get_document_chunks(self, doc_id: str) -> List[Dict[str, Any]]:
+        """Return a document's chunk metadata in chunk order without scanning the corpus"""
+        doc_chunks = [self.chunk_metadata[idx] for idx in self.doc_to_chunks.get(doc_id, [])]
+        doc_chunks.sort(key=lambda chunk: chunk['chunk_index'])
+        return doc_chunks
+
+    def _encode_query_uncached(self, query: str) -> np.ndarray:
+        """Encode a single query into a normalized float32 vector"""
+        query_embedding = self.embedding_model.encode(
+            [query], convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(query_embedding, dtype='float32')
+
+    def _collect_search_results(self, scores, indices) -> List[Dict[str, Any]]:
+        """Assemble metadata records for one query's search results"""
         results = []
-        for score, idx in zip(scores[0], indices[0]):
+        for score, idx in zip(scores, indices):
             if idx != -1:  # Valid index
                 result = self.chunk_metadata[idx].copy()
                 result['similarity_score'] = float(score)
                 results.append(result)
-        
+
         return results
     
     def save_index(self, filepath: str) -> None:
@@ -118,34 +422,85 @@ class DocumentProcessor:
         if self.faiss_index is None:
             raise ValueError("No index to save")
             
-        # Save FAISS index
-        faiss.write_index(self.faiss_index, f"{filepath}.faiss")
-        
-        # Save metadata and chunks
-        with open(f"{filepath}_metadata.pkl", 'wb') as f:
-            pickle.dump({
-                'chunks': self.chunks,
-                'chunk_metadata': self.chunk_metadata,
-                'embedding_dim': self.embedding_dim,
-                'chunk_size': self.chunk_size,
-                'chunk_overlap': self.chunk_overlap
-            }, f)
+        # Save FAISS index (GPU indexes must be serialized from their CPU form)
+        index_to_save = self.faiss_index
+        if self._index_on_gpu:
+            index_to_save = faiss.index_gpu_to_cpu(self.faiss_index)
+        faiss.write_index(index_to_save, f"{filepath}.faiss")
         
+        # Save metadata and chunks (Arrow when available, pickle otherwise)
+        params = {
+            'embedding_dim': self.embedding_dim,
+            'chunk_size': self.chunk_size,
+            'chunk_overlap': self.chunk_overlap,
+            'nprobe': self.nprobe
+        }
+        if pa is not None:
+            # Typed columnar layout; uncompressed so loads can memory-map
+            table = pa.Table.from_pylist(self.chunk_metadata)
+            table = table.replace_schema_metadata(
+                {b'lexilocal_params': json.dumps(params).encode()}
+            )
+            feather.write_feather(
+                table, f"{filepath}_metadata.arrow", compression='uncompressed'
+            )
+        else:
+            with open(f"{filepath}_metadata.pkl", 'wb') as f:
+                pickle.dump({
+                    'chunks': self.chunks,
+                    'chunk_metadata': self.chunk_metadata,
+                    **params
+                }, f)
+
         print(f"Index and metadata saved to {filepath}")
-    
+
     def load_index(self, filepath: str) -> None:
         """Load FAISS index and metadata from disk"""
-        # Load FAISS index
-        self.faiss_index = faiss.read_index(f"{filepath}.faiss")
-        
-        # Load metadata and chunks
-        with open(f"{filepath}_metadata.pkl", 'rb') as f:
-            data = pickle.load(f)
-            self.chunks = data['chunks']
-            self.chunk_metadata = data['chunk_metadata']
-            self.embedding_dim = data['embedding_dim']
-            self.chunk_size = data['chunk_size'] 
-            self.chunk_overlap = data['chunk_overlap']
+        if faiss is None:
+            raise RuntimeError("faiss is required to load a saved index")
+
+        # Load FAISS index; mmap pages vectors in on demand instead of
+        # reading the whole file into RAM up front
+        index_path = f"{filepath}.faiss"
+        try:
+            self.faiss_index = faiss.read_index(
+                index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except RuntimeError:
+            # Not every index type supports mmap reads
+            self.faiss_index = faiss.read_index(index_path)
+
+        # Load metadata and chunks; prefer the memory-mapped Arrow file and
+        # fall back to legacy pickle
+        arrow_path = f"{filepath}_metadata.arrow"
+        if pa is not None and os.path.exists(arrow_path):
+            table = feather.read_table(arrow_path, memory_map=True)
+            schema_meta = table.schema.metadata or {}
+            params = json.loads(schema_meta.get(b'lexilocal_params', b'{}'))
+            self.chunk_metadata = table.to_pylist()
+            self.chunks = table.column('text').to_pylist()
+            self.embedding_dim = params.get('embedding_dim', self.embedding_dim)
+            self.chunk_size = params.get('chunk_size', self.chunk_size)
+            self.chunk_overlap = params.get('chunk_overlap', self.chunk_overlap)
+            self.nprobe = params.get('nprobe', self.nprobe)
+        else:
+            with open(f"{filepath}_metadata.pkl", 'rb') as f:
+                data = pickle.load(f)
+                self.chunks = data['chunks']
+                self.chunk_metadata = data['chunk_metadata']
+                self.embedding_dim = data['embedding_dim']
+                self.chunk_size = data['chunk_size']
+                self.chunk_overlap = data['chunk_overlap']
+                self.nprobe = data.get('nprobe', self.nprobe)
+
+        self.doc_ids_seen = {meta['doc_id'] for meta in self.chunk_metadata}
+        self._rebuild_doc_index()
+
+        # Restore search-time parameters for IVF-style indexes
+        if hasattr(self.faiss_index, 'nprobe'):
+            self.faiss_index.nprobe = self.nprobe
+
+        self._maybe_move_index_to_gpu()
         
         print(f"Index and metadata loaded from {filepath}")
 
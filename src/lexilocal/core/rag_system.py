@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -8,11 +10,19 @@ from langchain_core.runnables import RunnablePassthrough
 from .document_processor import DocumentProcessor
 from ..data.mock_data import get_mock_dataset
 
+# Context block rendered per retrieved chunk in _format_context
+_CONTEXT_TEMPLATE = """
+--- Document {i}: {title} ---
+Citation: {citation}
+Content: {text}
+"""
+
 class LegalRAGSystem:
-    def __init__(self, 
+    def __init__(self,
                  model_name: str = "llama3.2:1b",
                  chunk_size: int = 1000,
-                 chunk_overlap: int = 200):
+                 chunk_overlap: int = 200,
+                 embedding_cache_dir: str = None):
         """Initialize the Legal RAG system"""
         self.model_name = model_name
         
@@ -24,7 +34,8 @@ class LegalRAGSystem:
         print("Initializing document processor...")
         self.doc_processor = DocumentProcessor(
             chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap
+            chunk_overlap=chunk_overlap,
+            embedding_cache_dir=embedding_cache_dir
         )
         
         # Initialize prompts
@@ -32,7 +43,14 @@ class LegalRAGSystem:
         
         # Initialize chains
         self._setup_chains()
-        
+
+        # LRU cache of full Q&A results; repeat questions skip the whole
+        # embed + search + LLM path. Locked because ask_question may run
+        # from several threads (e.g. the performance test's executor).
+        self._answer_cache = OrderedDict()
+        self._answer_cache_size = 128
+        self._answer_cache_lock = threading.Lock()
+
     def _setup_prompts(self):
         """Set up prompt templates for different tasks"""
         
@@ -95,17 +113,10 @@ Document to summarize:
         
     def _format_context(self, context_chunks: List[Dict[str, Any]]) -> str:
         """Format retrieved context chunks for the prompt"""
-        formatted_chunks = []
-        
-        for i, chunk in enumerate(context_chunks, 1):
-            chunk_text = f"""
---- Document {i}: {chunk['title']} ---
-Citation: {chunk['citation']}
-Content: {chunk['text']}
-"""
-            formatted_chunks.append(chunk_text)
-        
-        return "\n".join(formatted_chunks)
+        return "\n".join(
+            _CONTEXT_TEMPLATE.format(i=i, **chunk)
+            for i, chunk in enumerate(context_chunks, 1)
+        )
     
     def load_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Load and process documents for RAG"""
@@ -126,7 +137,14 @@ Content: {chunk['text']}
     def ask_question(self, question: str, k: int = 3) -> Dict[str, Any]:
         """Answer a question using RAG"""
         print(f"Processing question: {question}")
-        
+
+        # Serve repeat questions from the cache
+        cache_key = (question, k, self.model_name)
+        with self._answer_cache_lock:
+            if cache_key in self._answer_cache:
+                self._answer_cache.move_to_end(cache_key)
+                return self._answer_cache[cache_key]
+
         # Retrieve relevant chunks
         relevant_chunks = self.doc_processor.search_similar_chunks(question, k=k)
         
@@ -152,12 +170,42 @@ Content: {chunk['text']}
                 "similarity_score": chunk['similarity_score']
             })
         
-        return {
+        result = {
             "answer": answer,
             "sources": sources,
             "context_used": relevant_chunks
         }
+
+        with self._answer_cache_lock:
+            self._answer_cache[cache_key] = result
+            if len(self._answer_cache) > self._answer_cache_size:
+                self._answer_cache.popitem(last=False)
+
+        return result
     
+    def ask_question_stream(self, question: str, k: int = 3,
+                            context_chunks: List[Dict[str, Any]] = None):
+        """Answer a question using RAG, yielding response tokens as generated
+
+        Retrieval runs up front; pass context_chunks to reuse chunks that
+        were already retrieved (e.g. to display sources before streaming).
+        """
+        if context_chunks is None:
+            context_chunks = self.doc_processor.search_similar_chunks(question, k=k)
+
+        if not context_chunks:
+            yield "I couldn't find relevant information in the legal documents to answer your question."
+            return
+
+        yield from self.qa_chain.stream({
+            "context": context_chunks,
+            "question": question
+        })
+
+    def summarize_document_stream(self, document_text: str):
+        """Summarize a legal document, yielding summary tokens as generated"""
+        yield from self.summary_chain.stream(document_text)
+
     def summarize_document(self, document_text: str) -> str:
         """Summarize a legal document"""
         print("Generating document summary...")
@@ -178,14 +226,11 @@ Content: {chunk['text']}
                 "source": None
             }
         
-        # Get the full document text (combine all chunks from the same document)
+        # Get the full document text (combine all chunks from the same
+        # document, via the precomputed doc_id -> chunks index)
         doc_id = search_results[0]['doc_id']
-        doc_chunks = [chunk for chunk in self.doc_processor.chunk_metadata 
-                     if chunk['doc_id'] == doc_id]
-        
-        # Sort chunks by index
-        doc_chunks.sort(key=lambda x: x['chunk_index'])
-        
+        doc_chunks = self.doc_processor.get_document_chunks(doc_id)
+
         # Combine all chunks
         full_text = "\n".join([chunk['text'] for chunk in doc_chunks])
         
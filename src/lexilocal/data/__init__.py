@@ -1,6 +1,13 @@
 """Data handling modules for LexiLocal."""
 
-from .mock_data import get_mock_dataset
-from .dataset_loader import DatasetLoader
+__all__ = ["get_mock_dataset", "DatasetLoader"]
 
-__all__ = ["get_mock_dataset", "DatasetLoader"]
\ No newline at end of file
+def __getattr__(name):
+    # Defer dataset_loader: the HF datasets import alone costs ~1s
+    if name == "get_mock_dataset":
+        from .mock_data import get_mock_dataset
+        return get_mock_dataset
+    if name == "DatasetLoader":
+        from .dataset_loader import DatasetLoader
+        return DatasetLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -34,13 +34,11 @@ def explore_dataset():
         else:
             print(f"{key}: {value}")
     
-    # Analyze document lengths
+    # Analyze document lengths (columnar access pulls the whole column in
+    # one Arrow->Python conversion instead of one per row)
     print("\nAnalyzing document lengths...")
-    doc_lengths = []
-    for i in range(min(1000, len(data))):  # Sample first 1000 documents
-        doc = data[i]['document']
-        if doc:
-            doc_lengths.append(len(doc))
+    texts = data.select(range(min(1000, len(data))))['document']  # Sample first 1000 documents
+    doc_lengths = np.fromiter((len(doc) for doc in texts if doc), dtype=np.int64)
     
     print(f"Average document length: {np.mean(doc_lengths):.0f} characters")
     print(f"Median document length: {np.median(doc_lengths):.0f} characters")
@@ -5,25 +5,76 @@ Dataset loading utilities for various data sources.
 
 import os
 from typing import List, Dict, Any, Optional
-from datasets import load_dataset
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Required document fields and their defaults, merged into each record at
+# C level instead of per-field setdefault calls
+DOCUMENT_DEFAULTS = {
+    'id': '',
+    'title': 'Untitled',
+    'citation': '',
+    'state': '',
+    'issuer': ''
+}
+
 class DatasetLoader:
     """Unified interface for loading datasets from various sources."""
     
     def __init__(self):
         self.supported_sources = ["huggingface", "local", "mock"]
     
-    def load_huggingface_dataset(
-        self, 
-        dataset_name: str, 
+    def iter_huggingface_dataset(
+        self,
+        dataset_name: str,
         config: str = "default",
         split: str = "train",
         num_samples: Optional[int] = None
+    ):
+        """Stream documents from HuggingFace Hub one at a time.
+
+        Only the requested rows are pulled off the wire, so memory stays flat
+        and callers can start processing before the download finishes.
+        """
+        from datasets import load_dataset
+
+        logger.info(f"Streaming HuggingFace dataset: {dataset_name}")
+
+        dataset = load_dataset(dataset_name, config, split=split, streaming=True)
+        if num_samples:
+            dataset = dataset.take(num_samples)
+
+        for item in dataset:
+            yield {
+                'id': item.get('id', ''),
+                'title': item.get('title', 'Untitled'),
+                'citation': item.get('citation', ''),
+                'state': item.get('state', ''),
+                'issuer': item.get('issuer', ''),
+                'document': item.get('document', '')
+            }
+
+    def load_huggingface_dataset(
+        self,
+        dataset_name: str,
+        config: str = "default",
+        split: str = "train",
+        num_samples: Optional[int] = None,
+        streaming: bool = False
     ) -> List[Dict[str, Any]]:
         """Load dataset from HuggingFace Hub."""
+        if streaming:
+            documents = list(self.iter_huggingface_dataset(
+                dataset_name, config, split, num_samples
+            ))
+            logger.info(f"Successfully streamed {len(documents)} documents")
+            return documents
+
+        # Imported here: the datasets package pulls in pyarrow and pandas,
+        # a cost callers of load_local_files/validate_documents shouldn't pay
+        from datasets import load_dataset
+
         try:
             logger.info(f"Loading HuggingFace dataset: {dataset_name}")
             
@@ -31,18 +82,17 @@ class DatasetLoader:
                 split = f"{split}[:{num_samples}]"
             
             dataset = load_dataset(dataset_name, config, split=split)
-            
-            documents = []
-            for item in dataset:
-                documents.append({
-                    'id': item.get('id', ''),
-                    'title': item.get('title', 'Untitled'),
-                    'citation': item.get('citation', ''),
-                    'state': item.get('state', ''),
-                    'issuer': item.get('issuer', ''),
-                    'document': item.get('document', '')
-                })
-            
+
+            # Pull whole columns out of Arrow storage in one C call each
+            # instead of converting row dicts one at a time
+            fields = ['id', 'title', 'citation', 'state', 'issuer', 'document']
+            columns = {
+                field: dataset[field] if field in dataset.column_names
+                else [DOCUMENT_DEFAULTS.get(field, '')] * len(dataset)
+                for field in fields
+            }
+            documents = [dict(zip(fields, row)) for row in zip(*columns.values())]
+
             logger.info(f"Successfully loaded {len(documents)} documents")
             return documents
             
@@ -80,21 +130,14 @@ class DatasetLoader:
     
     def validate_documents(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Validate and clean document data."""
-        valid_documents = []
-        
-        for doc in documents:
-            if not doc.get('document', '').strip():
-                logger.warning(f"Skipping document with empty content: {doc.get('id', 'unknown')}")
-                continue
-            
-            # Ensure all required fields exist
-            doc.setdefault('id', '')
-            doc.setdefault('title', 'Untitled')
-            doc.setdefault('citation', '')
-            doc.setdefault('state', '')
-            doc.setdefault('issuer', '')
-            
-            valid_documents.append(doc)
-        
+        valid_documents = [
+            {**DOCUMENT_DEFAULTS, **doc}
+            for doc in documents
+            if doc.get('document', '').strip()
+        ]
+
+        skipped = len(documents) - len(valid_documents)
+        if skipped:
+            logger.warning(f"Skipped {skipped} documents with empty content")
         logger.info(f"Validated {len(valid_documents)}/{len(documents)} documents")
         return valid_documents
\ No newline at end of file
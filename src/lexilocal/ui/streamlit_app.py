@@ -9,11 +9,17 @@ from lexilocal.utils.streamlit_fixes import init_streamlit_compatibility
 init_streamlit_compatibility()
 
 import streamlit as st
+import hashlib
+import html
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from ..core.rag_system import LegalRAGSystem
+from ..data.dataset_loader import DOCUMENT_DEFAULTS
 from ..data.mock_data import get_mock_dataset
+from ..utils.semantic_cache import QASemanticCache
 from datasets import load_dataset
 
 # Page configuration
@@ -71,6 +77,12 @@ def initialize_session_state():
         st.session_state.documents_loaded = False
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
+    if 'chat_html' not in st.session_state:
+        st.session_state.chat_html = []
+    if 'qa_cache' not in st.session_state:
+        st.session_state.qa_cache = None
+    if 'available_docs' not in st.session_state:
+        st.session_state.available_docs = None
 
 @st.cache_resource
 def load_rag_system(model_name: str):
@@ -87,6 +99,119 @@ def load_mock_data():
     """Load mock data"""
     return get_mock_dataset()
 
+@st.cache_data(show_spinner=False, ttl=24 * 3600, max_entries=4)
+def load_hf_legal_subset(num_docs: int):
+    """Stream and normalize the first num_docs HuggingFace case-law documents
+
+    Streaming pulls only the requested rows off the wire instead of
+    downloading whole dataset shards, so load time scales with num_docs.
+    Cached so repeat "Load Documents" clicks reuse the memoized list.
+    """
+    dataset = load_dataset(
+        "HFforLegal/case-law", "default", split="train", streaming=True
+    )
+
+    # Restrict to the fields we keep before Arrow-to-Python conversion, so
+    # unused columns are never decoded; rows then merge over the defaults
+    # in one C-level dict build instead of six .get calls each
+    wanted = list(DOCUMENT_DEFAULTS) + ['document']
+    if dataset.column_names:
+        wanted = [col for col in wanted if col in dataset.column_names]
+    dataset = dataset.select_columns(wanted)
+
+    defaults = {**DOCUMENT_DEFAULTS, 'document': ''}
+    return [{**defaults, **item} for item in dataset.take(num_docs)]
+
+@st.cache_data(show_spinner=False)
+def cached_summary(model_name: str, title: str):
+    """Memoize summaries per (model, title) so repeat clicks skip the LLM call
+
+    The rag_system resource is itself keyed by model_name, so that plus the
+    title uniquely identifies a summary.
+    """
+    return st.session_state.rag_system.summarize_by_title(title)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_search(query: str, k: int):
+    """Memoize search results briefly so repeat queries skip the embed + probe"""
+    return st.session_state.rag_system.doc_processor.search_similar_chunks(query, k=k)
+
+def _index_cache_path(documents: list) -> str:
+    """Cache path for this document set's saved index, keyed by doc ids"""
+    fingerprint = hashlib.sha1(
+        repr(sorted(str(doc.get('id', '')) for doc in documents)).encode()
+    ).hexdigest()[:12]
+    return os.path.join(
+        os.path.expanduser("~/.cache/lexilocal"), f"idx_{fingerprint}"
+    )
+
+def load_documents_with_status(documents: list):
+    """Chunk and embed documents with live progress feedback
+
+    The embedding pass runs in a worker thread while the script thread
+    polls it and pushes elapsed-time updates to the status widget, so the
+    user sees progress for the length of the pass instead of a frozen
+    spinner. Indexes are persisted per document set, so restarting the app
+    reloads the saved index (a memory-mapped read) instead of re-embedding
+    everything.
+    """
+    index_path = _index_cache_path(documents)
+    if os.path.exists(f"{index_path}.faiss"):
+        with st.status("Loading cached index...") as status:
+            st.session_state.rag_system.load_index(index_path)
+            status.update(label="Index loaded from cache", state="complete")
+    else:
+        with st.status(f"Embedding {len(documents)} documents...") as status:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    st.session_state.rag_system.load_documents, documents
+                )
+                started = time.time()
+                while not future.done():
+                    status.update(
+                        label=f"Embedding {len(documents)} documents... "
+                              f"({time.time() - started:.0f}s elapsed)"
+                    )
+                    time.sleep(0.5)
+                future.result()  # re-raise any worker exception
+            status.update(label="Documents embedded and indexed", state="complete")
+
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        st.session_state.rag_system.save_index(index_path)
+
+    # Build the title -> first-chunk map once per load; reruns read it from
+    # session_state instead of scanning all chunk metadata every interaction
+    available_docs = {}
+    for chunk in st.session_state.rag_system.doc_processor.chunk_metadata:
+        available_docs.setdefault(chunk['title'], chunk)
+    st.session_state.available_docs = available_docs
+
+def chat_fragment(role: str, content: str, sources: list = None) -> str:
+    """Render one finished chat turn as a static HTML fragment
+
+    Past turns are kept as pre-rendered strings so the whole history is a
+    single st.markdown call per rerun instead of one widget per message.
+    """
+    body = html.escape(content).replace("\n", "<br>")
+    if role == 'user':
+        return f'<div class="info-box"><strong>🧑 You</strong><br>{body}</div>'
+
+    parts = [f'<div class="info-box"><strong>⚖️ LexiLocal</strong><br>{body}']
+    for i, source in enumerate(sources or [], 1):
+        # HuggingFace rows can carry null titles/citations; coerce before
+        # escaping so one bad source doesn't fail the whole turn
+        title = html.escape(str(source["title"] or ""))
+        citation = html.escape(str(source["citation"] or ""))
+        parts.append(
+            f'<div class="source-box">'
+            f'<strong>{i}. {title}</strong><br>'
+            f'<em>Citation:</em> {citation}<br>'
+            f'<em>Relevance Score:</em> {source["similarity_score"]:.3f}'
+            f'</div>'
+        )
+    parts.append('</div>')
+    return "".join(parts)
+
 def display_sources(sources: list):
     """Display source information"""
     if sources:
@@ -126,6 +251,13 @@ def main():
             ["Mock Legal Documents", "Upload Documents", "HuggingFace Dataset"],
             help="Select the source of legal documents to analyze"
         )
+
+        if data_source == "HuggingFace Dataset":
+            num_hf_docs = st.number_input(
+                "Number of documents to load",
+                min_value=1, max_value=1000, value=10,
+                help="Only this many documents are streamed from HuggingFace"
+            )
         
         # Load RAG system
         if st.button("🚀 Initialize AI System", type="primary"):
@@ -139,34 +271,24 @@ def main():
         if st.session_state.rag_system and not st.session_state.documents_loaded:
             if st.button("📚 Load Documents", type="secondary"):
                 try:
-                    with st.spinner("Loading documents..."):
-                        if data_source == "Mock Legal Documents":
-                            documents = load_mock_data()
-                            st.session_state.rag_system.load_documents(documents)
-                            st.session_state.documents_loaded = True
-                            st.success(f"Loaded {len(documents)} mock legal documents!")
-                        
-                        elif data_source == "HuggingFace Dataset":
-                            # Load a subset of the HuggingFace dataset
-                            with st.spinner("Downloading HuggingFace dataset..."):
-                                dataset = load_dataset("HFforLegal/case-law", "default", split="train[:10]")
-                                documents = []
-                                for item in dataset:
-                                    documents.append({
-                                        'id': item.get('id', ''),
-                                        'title': item.get('title', 'Untitled'),
-                                        'citation': item.get('citation', ''),
-                                        'state': item.get('state', ''),
-                                        'issuer': item.get('issuer', ''),
-                                        'document': item.get('document', '')
-                                    })
-                                st.session_state.rag_system.load_documents(documents)
-                                st.session_state.documents_loaded = True
-                                st.success(f"Loaded {len(documents)} documents from HuggingFace!")
-                        
-                        else:  # Upload Documents
-                            st.info("Document upload feature coming soon!")
-                            
+                    if data_source == "Mock Legal Documents":
+                        documents = load_mock_data()
+                        load_documents_with_status(documents)
+                        st.session_state.documents_loaded = True
+                        st.success(f"Loaded {len(documents)} mock legal documents!")
+
+                    elif data_source == "HuggingFace Dataset":
+                        # Load a subset of the HuggingFace dataset
+                        with st.spinner("Downloading HuggingFace dataset..."):
+                            documents = load_hf_legal_subset(int(num_hf_docs))
+                        load_documents_with_status(documents)
+                        st.session_state.documents_loaded = True
+                        st.success(f"Loaded {len(documents)} documents from HuggingFace!")
+
+                    else:  # Upload Documents
+                        st.info("Document upload feature coming soon!")
+
+
                 except Exception as e:
                     st.error(f"Error loading documents: {str(e)}")
         
@@ -214,43 +336,70 @@ def main():
     with tab1:
         st.header("💬 Legal Q&A Chat")
         
-        # Display chat history
-        for message in st.session_state.chat_history:
-            if message['role'] == 'user':
-                st.chat_message("user").write(message['content'])
-            else:
-                with st.chat_message("assistant"):
-                    st.write(message['content'])
-                    if 'sources' in message:
-                        display_sources(message['sources'])
-        
+        # Display chat history: pre-rendered fragments in one markdown call,
+        # so the widget tree doesn't grow with conversation length
+        if st.session_state.chat_html:
+            st.markdown("".join(st.session_state.chat_html), unsafe_allow_html=True)
+
         # Chat input
         if question := st.chat_input("Ask a legal question..."):
             # Add user message to chat history
             st.session_state.chat_history.append({'role': 'user', 'content': question})
+            st.session_state.chat_html.append(chat_fragment('user', question))
             st.chat_message("user").write(question)
             
             # Generate response
+            # Semantic cache: paraphrased repeats of earlier questions skip
+            # retrieval and the LLM call entirely
+            if st.session_state.qa_cache is None:
+                st.session_state.qa_cache = QASemanticCache(
+                    st.session_state.rag_system.doc_processor.embedding_model
+                )
+
             with st.chat_message("assistant"):
-                with st.spinner("Analyzing documents and generating response..."):
-                    try:
-                        result = st.session_state.rag_system.ask_question(question)
+                try:
+                    result = st.session_state.qa_cache.lookup(question)
+                    if result is not None:
                         st.write(result['answer'])
-                        
-                        # Add to chat history
-                        st.session_state.chat_history.append({
-                            'role': 'assistant', 
-                            'content': result['answer'],
-                            'sources': result['sources']
-                        })
-                        
-                        # Display sources
-                        display_sources(result['sources'])
-                        
-                    except Exception as e:
-                        error_msg = f"Error generating response: {str(e)}"
-                        st.error(error_msg)
-                        st.session_state.chat_history.append({'role': 'assistant', 'content': error_msg})
+                    else:
+                        # Retrieve first, then stream tokens as they arrive
+                        # so the first words show up in ~TTFT instead of
+                        # after the full generation
+                        rag_system = st.session_state.rag_system
+                        with st.spinner("Searching documents..."):
+                            chunks = rag_system.doc_processor.search_similar_chunks(question, k=3)
+                        answer = st.write_stream(
+                            rag_system.ask_question_stream(question, context_chunks=chunks)
+                        )
+                        result = {
+                            'answer': answer,
+                            'sources': [{
+                                'title': chunk['title'],
+                                'citation': chunk['citation'],
+                                'similarity_score': chunk['similarity_score']
+                            } for chunk in chunks],
+                            'context_used': chunks
+                        }
+                        st.session_state.qa_cache.add(question, result)
+
+                    # Add to chat history
+                    st.session_state.chat_history.append({
+                        'role': 'assistant',
+                        'content': result['answer'],
+                        'sources': result['sources']
+                    })
+                    st.session_state.chat_html.append(
+                        chat_fragment('assistant', result['answer'], result['sources'])
+                    )
+
+                    # Display sources
+                    display_sources(result['sources'])
+
+                except Exception as e:
+                    error_msg = f"Error generating response: {str(e)}"
+                    st.error(error_msg)
+                    st.session_state.chat_history.append({'role': 'assistant', 'content': error_msg})
+                    st.session_state.chat_html.append(chat_fragment('assistant', error_msg))
     
     with tab2:
         st.header("📄 Document Summarization")
@@ -260,14 +409,10 @@ def main():
         with col1:
             st.subheader("Choose Document")
             
-            # Get available documents
-            if hasattr(st.session_state.rag_system.doc_processor, 'chunk_metadata'):
-                available_docs = {}
-                for chunk in st.session_state.rag_system.doc_processor.chunk_metadata:
-                    doc_title = chunk['title']
-                    if doc_title not in available_docs:
-                        available_docs[doc_title] = chunk
-                
+            # Get available documents (built once when documents are loaded)
+            if st.session_state.available_docs:
+                available_docs = st.session_state.available_docs
+
                 selected_doc = st.selectbox(
                     "Select document to summarize:",
                     list(available_docs.keys())
@@ -276,7 +421,7 @@ def main():
                 if st.button("📝 Generate Summary", type="primary"):
                     with st.spinner("Generating summary..."):
                         try:
-                            result = st.session_state.rag_system.summarize_by_title(selected_doc)
+                            result = cached_summary(model_name, selected_doc)
                             
                             with col2:
                                 st.subheader("Summary")
@@ -296,11 +441,15 @@ def main():
     with tab3:
         st.header("🔍 Document Search")
         
-        search_query = st.text_input("Enter search terms:", placeholder="e.g., contract breach, constitutional rights, patent infringement")
-        
-        if search_query:
+        # The form defers the query embedding + FAISS probe to an explicit
+        # submit instead of re-running them on every keystroke rerun
+        with st.form("search_form"):
+            search_query = st.text_input("Enter search terms:", placeholder="e.g., contract breach, constitutional rights, patent infringement")
+            submitted = st.form_submit_button("🔍 Search")
+
+        if submitted and search_query:
             try:
-                results = st.session_state.rag_system.doc_processor.search_similar_chunks(search_query, k=5)
+                results = cached_search(search_query, k=5)
                 
                 if results:
                     st.subheader(f"Search Results for: '{search_query}'")
@@ -1,7 +1,9 @@
 """Utility modules for LexiLocal."""
 
-from .logging_config import setup_logging
+from .logging_config import setup_logging, shutdown_logging
 from .performance_metrics import PerformanceMetrics
 from .streamlit_fixes import init_streamlit_compatibility
+from .perf import configure_threading
+from .semantic_cache import QASemanticCache
 
-__all__ = ["setup_logging", "PerformanceMetrics", "init_streamlit_compatibility"]
\ No newline at end of file
+__all__ = ["setup_logging", "shutdown_logging", "PerformanceMetrics", "init_streamlit_compatibility", "configure_threading", "QASemanticCache"]
\ No newline at end of file
@@ -4,9 +4,14 @@ Logging configuration for LexiLocal.
 """
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# Keep the listener alive for the life of the process; replaced on re-setup
+_listener: Optional[QueueListener] = None
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
@@ -14,31 +19,51 @@ def setup_logging(
 ) -> None:
     """
     Set up logging configuration for the application.
-    
+
+    Log records are handed off through a queue to a background listener
+    thread, so callers never block on console or file writes — this keeps
+    DEBUG-level instrumentation (e.g. measure_time) out of hot paths.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         format_string: Custom format string for logs
     """
+    global _listener
+
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=format_string,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-    
-    # Add file handler if specified
+
+    formatter = logging.Formatter(format_string)
+
+    # Real handlers live behind the queue, attached to the listener thread
+    # rather than the root logger
+    real_handlers = [logging.StreamHandler(sys.stdout)]
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(format_string))
-        logging.getLogger().addHandler(file_handler)
-    
+        real_handlers.append(logging.FileHandler(log_file))
+    for handler in real_handlers:
+        handler.setFormatter(formatter)
+
+    shutdown_logging()
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper()))
+    root.handlers = [QueueHandler(log_queue)]
+
+    _listener = QueueListener(
+        log_queue, *real_handlers, respect_handler_level=True
+    )
+    _listener.start()
+
     # Set specific logger levels
     logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
     logging.getLogger("transformers").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+def shutdown_logging() -> None:
+    """Stop the background log listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
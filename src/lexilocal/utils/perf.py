@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+CPU threading configuration for the numerical libraries.
+"""
+
+import os
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_configured = False
+
+def configure_threading(num_threads: Optional[int] = None) -> None:
+    """
+    Tune torch/OpenMP/MKL thread counts once per process.
+
+    Args:
+        num_threads: Intra-op thread count (defaults to the EMBEDDING_THREADS
+            environment variable, falling back to the CPU count)
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    if num_threads is None:
+        num_threads = int(os.environ.get("EMBEDDING_THREADS", os.cpu_count() or 1))
+
+    # OpenMP/MKL only honor these before their thread pools spin up, so set
+    # them ahead of any torch work
+    os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+    os.environ.setdefault("MKL_NUM_THREADS", str(num_threads))
+
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(2)
+        except RuntimeError:
+            # Interop pool already started; keep the existing setting
+            pass
+    except ImportError:
+        pass
+
+    # Cap FAISS's OpenMP pool so IVF probing parallelizes without
+    # oversubscribing against torch's intra-op threads
+    try:
+        import faiss
+        faiss.omp_set_num_threads(min(8, num_threads))
+    except (ImportError, AttributeError):
+        pass
+
+    logger.debug(f"Threading configured for {num_threads} threads")
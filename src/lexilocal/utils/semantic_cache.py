@@ -0,0 +1,81 @@
+"""Semantic similarity cache for Q&A results."""
+
+import numpy as np
+from typing import Any, Dict, Optional
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - faiss ships with the default install
+    faiss = None
+
+
+class QASemanticCache:
+    """Cache Q&A results keyed by question meaning rather than exact text
+
+    Cached questions live as normalized embeddings in a small inner-product
+    FAISS index. An incoming question whose nearest cached neighbour scores
+    above the similarity threshold is served that neighbour's result, so
+    paraphrased repeats skip retrieval and the LLM call entirely.
+    """
+
+    def __init__(self, embedding_model,
+                 similarity_threshold: float = 0.95,
+                 max_entries: int = 256):
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._results = []
+        if faiss is not None:
+            self._index = faiss.IndexFlatIP(
+                embedding_model.get_sentence_embedding_dimension()
+            )
+        else:
+            self._index = None
+        self._embeddings = None  # fallback matrix when FAISS is absent
+
+    def _encode(self, question: str) -> np.ndarray:
+        embedding = self.embedding_model.encode(
+            [question], convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embedding, dtype='float32')
+
+    def lookup(self, question: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a semantically similar question, if any"""
+        if not self._results:
+            return None
+
+        embedding = self._encode(question)
+        if self._index is not None:
+            scores, indices = self._index.search(embedding, 1)
+            score, idx = float(scores[0][0]), int(indices[0][0])
+        else:
+            similarities = self._embeddings @ embedding[0]
+            idx = int(np.argmax(similarities))
+            score = float(similarities[idx])
+
+        if idx != -1 and score >= self.similarity_threshold:
+            return self._results[idx]
+        return None
+
+    def add(self, question: str, result: Dict[str, Any]) -> None:
+        """Store a Q&A result under the question's embedding"""
+        if len(self._results) >= self.max_entries:
+            # Dropping the whole cache on overflow keeps the FAISS index and
+            # result list trivially in sync; overflow is rare at this size
+            self.clear()
+
+        embedding = self._encode(question)
+        if self._index is not None:
+            self._index.add(embedding)
+        elif self._embeddings is None:
+            self._embeddings = embedding
+        else:
+            self._embeddings = np.vstack([self._embeddings, embedding])
+        self._results.append(result)
+
+    def clear(self) -> None:
+        """Empty the cache"""
+        if self._index is not None:
+            self._index.reset()
+        self._embeddings = None
+        self._results = []
@@ -14,37 +14,39 @@ from lexilocal.core.document_processor import DocumentProcessor
 from lexilocal.data.mock_data import get_mock_dataset
 
 class TestDocumentProcessor(unittest.TestCase):
-    """Test cases for DocumentProcessor."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = DocumentProcessor(chunk_size=500, chunk_overlap=100)
-        self.mock_docs = get_mock_dataset()
-    
+    """Test cases for DocumentProcessor.
+
+    The processor (and its embedding model) is built and run once in
+    setUpClass; tests read the shared processed state rather than
+    re-embedding the corpus per test.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures once for the class."""
+        cls.processor = DocumentProcessor(chunk_size=500, chunk_overlap=100)
+        cls.mock_docs = get_mock_dataset()
+        cls.processor.process_documents(cls.mock_docs)
+
     def test_initialization(self):
         """Test processor initialization."""
         self.assertEqual(self.processor.chunk_size, 500)
         self.assertEqual(self.processor.chunk_overlap, 100)
         self.assertIsNotNone(self.processor.embedding_model)
         self.assertIsNotNone(self.processor.text_splitter)
-    
+
     def test_document_processing(self):
         """Test document processing pipeline."""
-        self.processor.process_documents(self.mock_docs)
-        
         # Check that chunks were created
         self.assertGreater(len(self.processor.chunks), 0)
         self.assertEqual(len(self.processor.chunks), len(self.processor.chunk_metadata))
-        
+
         # Check FAISS index was created
         self.assertIsNotNone(self.processor.faiss_index)
         self.assertGreater(self.processor.faiss_index.ntotal, 0)
-    
+
     def test_search_functionality(self):
         """Test semantic search."""
-        self.processor.process_documents(self.mock_docs)
-        
-        # Test search
         results = self.processor.search_similar_chunks("contract breach", k=3)
         
         # Verify results
@@ -56,8 +58,6 @@ class TestDocumentProcessor(unittest.TestCase):
     
     def test_save_load_index(self):
         """Test saving and loading index."""
-        self.processor.process_documents(self.mock_docs)
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             index_path = os.path.join(temp_dir, "test_index")
             
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the non-FAISS similarity search kernels.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lexilocal.core._kernels import cosine_topk
+
+def _normalized(rng, rows, dim):
+    """Random L2-normalized float32 matrix."""
+    matrix = rng.standard_normal((rows, dim)).astype(np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+class TestCosineTopk(unittest.TestCase):
+    """Test cases for cosine_topk.
+
+    This kernel is the entire search path when FAISS is absent (and runs
+    the numba variant when the performance extra is installed), so it is
+    checked against a brute-force argsort reference.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared random fixtures."""
+        rng = np.random.default_rng(42)
+        cls.matrix = _normalized(rng, 50, 16)
+        cls.queries = _normalized(rng, 4, 16)
+
+    def test_matches_brute_force(self):
+        """Scores and indices match a full argsort, in descending order."""
+        k = 5
+        scores, indices = cosine_topk(self.queries, self.matrix, k)
+
+        self.assertEqual(scores.shape, (len(self.queries), k))
+        self.assertEqual(indices.shape, (len(self.queries), k))
+
+        reference = self.queries @ self.matrix.T
+        for row in range(len(self.queries)):
+            expected = np.argsort(-reference[row])[:k]
+            np.testing.assert_array_equal(indices[row], expected)
+            np.testing.assert_allclose(
+                scores[row], reference[row][expected], rtol=1e-5
+            )
+
+    def test_k_clamped_to_corpus_size(self):
+        """Asking for more results than vectors returns every vector once."""
+        k = self.matrix.shape[0] + 10
+        scores, indices = cosine_topk(self.queries, self.matrix, k)
+
+        self.assertEqual(scores.shape, (len(self.queries), self.matrix.shape[0]))
+        self.assertEqual(indices.shape, (len(self.queries), self.matrix.shape[0]))
+        for row in indices:
+            self.assertEqual(len(set(row)), self.matrix.shape[0])
+
+    def test_single_query(self):
+        """A single-row query keeps the (num_queries, k) result shape."""
+        scores, indices = cosine_topk(self.queries[:1], self.matrix, 3)
+
+        self.assertEqual(scores.shape, (1, 3))
+        self.assertEqual(indices.shape, (1, 3))
+        # Descending score order
+        self.assertTrue(np.all(np.diff(scores[0]) <= 0))
+
+if __name__ == '__main__':
+    unittest.main()
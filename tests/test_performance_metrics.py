@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PerformanceMetrics.
+"""
+
+import unittest
+import sys
+import os
+import json
+import statistics
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lexilocal.utils.performance_metrics import PerformanceMetrics, RECENT_SAMPLES
+
+class TestPerformanceMetrics(unittest.TestCase):
+    """Test cases for the Welford-based metrics collector."""
+
+    def test_summary_matches_statistics(self):
+        """Running mean/std agree with the statistics module."""
+        values = [0.5, 1.25, 2.0, 3.75, 5.5, 8.25]
+        metrics = PerformanceMetrics()
+        for value in values:
+            metrics.add_metric('qa_response_times', value)
+
+        summary = metrics.get_summary()['qa_response_times']
+        self.assertEqual(summary['count'], len(values))
+        self.assertAlmostEqual(summary['mean'], statistics.mean(values))
+        self.assertAlmostEqual(summary['std_dev'], statistics.stdev(values))
+        self.assertAlmostEqual(summary['median'], statistics.median(values))
+        self.assertEqual(summary['min'], min(values))
+        self.assertEqual(summary['max'], max(values))
+
+    def test_empty_metric_summary(self):
+        """Metrics with no samples summarize to zeros."""
+        summary = PerformanceMetrics().get_summary()['search_times']
+        self.assertEqual(summary['count'], 0)
+        self.assertEqual(summary['mean'], 0)
+        self.assertEqual(summary['std_dev'], 0)
+
+    def test_bounded_window_past_recent_samples(self):
+        """Aggregates cover all samples; the raw window stays bounded."""
+        total = RECENT_SAMPLES + 100
+        metrics = PerformanceMetrics()
+        for value in range(total):
+            metrics.add_metric('search_times', float(value))
+
+        summary = metrics.get_summary()['search_times']
+        # Full-history statistics from the running aggregates
+        self.assertEqual(summary['count'], total)
+        self.assertEqual(summary['min'], 0.0)
+        self.assertEqual(summary['max'], float(total - 1))
+        self.assertAlmostEqual(summary['mean'], (total - 1) / 2)
+        # Median is estimated from the last RECENT_SAMPLES values only
+        self.assertAlmostEqual(
+            summary['median'], statistics.median(range(100, total))
+        )
+
+        # Exports carry only the bounded window
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, 'metrics.json')
+            metrics.export_metrics(filepath)
+            with open(filepath) as f:
+                data = json.load(f)
+            raw = data['raw_data']['search_times']
+            self.assertEqual(len(raw), RECENT_SAMPLES)
+            self.assertEqual(raw[0], 100.0)
+            self.assertEqual(raw[-1], float(total - 1))
+
+if __name__ == '__main__':
+    unittest.main()